@@ -101,6 +101,9 @@ class App:
             max_overflow=config.db_max_overflow,
             pool_timeout=config.db_pool_timeout,
             pool_recycle=config.db_pool_recycle,
+            # Batch multi-row inserts instead of sending one statement per row
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
         )
 
         # Create scoped session factory for thread-safe database operations
@@ -200,7 +200,7 @@ class RedisManager:
                         allowed_to_store_context = True
                         for user_project in project_users:
                             user = crud.get_user_by_id(db_session, user_project.user_id)
-                            if user and not json.loads(user.preference).get(
+                            if user and not (user.preference or {}).get(
                                 "store_context", False
                             ):
                                 allowed_to_store_context = False
@@ -1,9 +1,11 @@
 import json
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Optional, Tuple, Type, Union
 
-from sqlalchemy import func, text
+from sqlalchemy import func, insert, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 import Queries as Queries
@@ -13,6 +15,24 @@ from database.embedding_service import encode_text
 from utils import hash_password, verify_password
 
 
+@contextmanager
+def batched(db: Session):
+    """
+    Defer the commits the create_* helpers issue until the block exits.
+
+    The helpers commit after every row, so composing several of them costs
+    one COMMIT fsync each. Inside this block db.commit() only flushes; a
+    single real commit runs when the block completes. Nothing is committed
+    if the block raises.
+    """
+    db.commit = db.flush  # type: ignore[method-assign]
+    try:
+        yield db
+    finally:
+        del db.commit
+    db.commit()
+
+
 # User
 def create_user(
     db: Session, user: Union[Queries.CreateUser, Queries.CreateUserOauth]
@@ -26,7 +46,7 @@ def create_user(
         password=hash_password(user.password.get_secret_value()),
         # configure default preference and config upon creation
         config_id=user.config_id,
-        preference=json.dumps(DEFAULT_USER_PREFERENCE),
+        preference=dict(DEFAULT_USER_PREFERENCE),
         is_oauth_signup=isinstance(user, Queries.CreateUserOauth),
         verified=False,
     )
@@ -37,25 +57,32 @@ def create_user(
 
 
 def get_user_by_id(db: Session, user_id: uuid.UUID) -> Optional[db_schemas.User]:
-    return db.query(db_schemas.User).filter(db_schemas.User.user_id == user_id).first()
+    return db.get(db_schemas.User, user_id)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[Type[db_schemas.User]]:
     return db.query(db_schemas.User).filter(db_schemas.User.email == email).first()
 
 
+def verify_user_password(user: db_schemas.User, password: str) -> bool:
+    """Check a password against an already-fetched user, skipping the SELECT."""
+    return verify_password(str(user.password), password)
+
+
 def get_user_by_email_password(
     db: Session, email: str, password: str
 ) -> Optional[db_schemas.User]:
     user = db.query(db_schemas.User).filter(db_schemas.User.email == email).first()
-    if user and verify_password(str(user.password), password):
+    if user and verify_user_password(user, password):
         return user
     return None
 
 
 def get_user_by_id_password(db: Session, user_id: uuid.UUID, password: str):
-    user = db.query(db_schemas.User).filter(db_schemas.User.user_id == user_id).first()
-    if user and verify_password(str(user.password), password):
+    # get_user_by_id goes through the identity map, so repeated attempts
+    # against the same user in one session re-verify without a second SELECT
+    user = get_user_by_id(db, user_id)
+    if user and verify_user_password(user, password):
         return user
     return None
 
@@ -69,8 +96,10 @@ def update_user(
     if update_data.get("password"):
         update_data["password"] = hash_password(update_data["password"])
     if update_data.get("preference"):
-        preference = DEFAULT_USER_PREFERENCE | json.loads(update_data["preference"])
-        update_data["preference"] = json.dumps(preference)
+        # JSONB column: store the merged preferences as a plain dict
+        update_data["preference"] = DEFAULT_USER_PREFERENCE | json.loads(
+            update_data["preference"]
+        )
     result = (
         db.query(db_schemas.User)
         .filter(db_schemas.User.user_id == user_id)
@@ -123,7 +152,7 @@ def delete_user_full_wipe_out(db: Session, user_id: uuid.UUID):
                 .filter(db_schemas.User.user_id == common_project_user.user_id)
                 .first()
             )
-            if common_user and json.loads(common_user.preference).get(
+            if common_user and (common_user.preference or {}).get(
                 "store_context", False
             ):
                 project_context_should_be_deleted = False
@@ -135,7 +164,7 @@ def delete_user_full_wipe_out(db: Session, user_id: uuid.UUID):
         elif project_context_should_be_deleted:
             db.query(db_schemas.Project).filter(
                 db_schemas.Project.project_id == project_user.project_id
-            ).update({"multi_file_contexts": "{}", "multi_file_context_changes": "{}"})
+            ).update({"multi_file_contexts": {}, "multi_file_context_changes": {}})
 
     db.query(db_schemas.ProjectUser).filter(
         db_schemas.ProjectUser.user_id == user_id
@@ -187,11 +216,7 @@ def create_context(
 def get_context_by_id(
     db: Session, context_id: uuid.UUID
 ) -> Optional[db_schemas.Context]:
-    return (
-        db.query(db_schemas.Context)
-        .filter(db_schemas.Context.context_id == context_id)
-        .first()
-    )
+    return db.get(db_schemas.Context, context_id)
 
 
 # Telemetry operations
@@ -229,24 +254,59 @@ def create_behavioral_telemetry(
     return db_telemetry
 
 
+def create_context_and_telemetries(
+    db: Session,
+    context: Queries.ContextData,
+    contextual_telemetry: Queries.ContextualTelemetryData,
+    behavioral_telemetry: Queries.BehavioralTelemetryData,
+) -> Tuple[
+    db_schemas.Context, db_schemas.ContextualTelemetry, db_schemas.BehavioralTelemetry
+]:
+    """
+    Create a context together with its telemetry rows in one transaction.
+
+    The three rows always travel together when a query is recorded; flushing
+    them in a single commit replaces three commits (and their round trips)
+    with one.
+    """
+    db_context = db_schemas.Context(
+        context_id=uuid.uuid4(),
+        prefix=context.prefix,
+        suffix=context.suffix,
+        file_name=context.file_name,
+        selected_text=context.selected_text,
+    )
+    db_contextual_telemetry = db_schemas.ContextualTelemetry(
+        contextual_telemetry_id=uuid.uuid4(),
+        version_id=contextual_telemetry.version_id,
+        trigger_type_id=contextual_telemetry.trigger_type_id,
+        language_id=contextual_telemetry.language_id,
+        file_path=contextual_telemetry.file_path,
+        caret_line=contextual_telemetry.caret_line,
+        document_char_length=contextual_telemetry.document_char_length,
+        relative_document_position=contextual_telemetry.relative_document_position,
+    )
+    db_behavioral_telemetry = db_schemas.BehavioralTelemetry(
+        behavioral_telemetry_id=uuid.uuid4(),
+        time_since_last_shown=behavioral_telemetry.time_since_last_shown,
+        time_since_last_accepted=behavioral_telemetry.time_since_last_accepted,
+        typing_speed=behavioral_telemetry.typing_speed,
+    )
+    db.add_all([db_context, db_contextual_telemetry, db_behavioral_telemetry])
+    db.commit()
+    return db_context, db_contextual_telemetry, db_behavioral_telemetry
+
+
 def get_contextual_telemetry_by_id(
     db: Session, telemetry_id: uuid.UUID
 ) -> Optional[db_schemas.ContextualTelemetry]:
-    return (
-        db.query(db_schemas.ContextualTelemetry)
-        .filter(db_schemas.ContextualTelemetry.contextual_telemetry_id == telemetry_id)
-        .first()
-    )
+    return db.get(db_schemas.ContextualTelemetry, telemetry_id)
 
 
 def get_behavioral_telemetry_by_id(
     db: Session, telemetry_id: uuid.UUID
 ) -> Optional[db_schemas.BehavioralTelemetry]:
-    return (
-        db.query(db_schemas.BehavioralTelemetry)
-        .filter(db_schemas.BehavioralTelemetry.behavioral_telemetry_id == telemetry_id)
-        .first()
-    )
+    return db.get(db_schemas.BehavioralTelemetry, telemetry_id)
 
 
 # MetaQuery operations
@@ -329,31 +389,19 @@ def create_chat_query(
 def get_meta_query_by_id(
     db: Session, meta_query_id: uuid.UUID
 ) -> Optional[db_schemas.MetaQuery]:
-    return (
-        db.query(db_schemas.MetaQuery)
-        .filter(db_schemas.MetaQuery.meta_query_id == meta_query_id)
-        .first()
-    )
+    return db.get(db_schemas.MetaQuery, meta_query_id)
 
 
 def get_completion_query_by_id(
     db: Session, meta_query_id: uuid.UUID
 ) -> Optional[db_schemas.CompletionQuery]:
-    return (
-        db.query(db_schemas.CompletionQuery)
-        .filter(db_schemas.CompletionQuery.meta_query_id == meta_query_id)
-        .first()
-    )
+    return db.get(db_schemas.CompletionQuery, meta_query_id)
 
 
 def get_chat_query_by_id(
     db: Session, meta_query_id: uuid.UUID
 ) -> Optional[db_schemas.ChatQuery]:
-    return (
-        db.query(db_schemas.ChatQuery)
-        .filter(db_schemas.ChatQuery.meta_query_id == meta_query_id)
-        .first()
-    )
+    return db.get(db_schemas.ChatQuery, meta_query_id)
 
 
 def get_chat_queries_for_chat(
@@ -405,6 +453,38 @@ def create_generation(
     return db_generation
 
 
+def create_generations_bulk(
+    db: Session, generations: List[Tuple[str, Queries.CreateGeneration]]
+) -> int:
+    """
+    Insert many (meta_query_id, generation) pairs in one executemany round trip.
+
+    Seeding generations one at a time through create_generation pays an
+    INSERT + commit per row; this batches all rows into a single statement.
+    Returns the number of inserted rows.
+    """
+    rows = [
+        {
+            "meta_query_id": (
+                uuid.UUID(meta_query_id)
+                if isinstance(meta_query_id, str)
+                else meta_query_id
+            ),
+            "model_id": generation.model_id,
+            "completion": generation.completion,
+            "generation_time": generation.generation_time,
+            "shown_at": [datetime.fromisoformat(ts) for ts in generation.shown_at],
+            "was_accepted": generation.was_accepted,
+            "confidence": generation.confidence,
+            "logprobs": generation.logprobs,
+        }
+        for meta_query_id, generation in generations
+    ]
+    result = db.execute(insert(db_schemas.HadGeneration), rows)
+    db.commit()
+    return result.rowcount
+
+
 def get_generations_by_meta_query(
     db: Session, meta_query_id: uuid.UUID
 ) -> list[db_schemas.HadGeneration]:
@@ -452,6 +532,16 @@ def get_generations_by_meta_query_id(
     )
 
 
+def count_generations_by_meta_query(db: Session, meta_query_id: uuid.UUID) -> int:
+    """Count a query's generations server-side without hydrating rows."""
+    return (
+        db.query(func.count())
+        .select_from(db_schemas.HadGeneration)
+        .filter(db_schemas.HadGeneration.meta_query_id == meta_query_id)
+        .scalar()
+    )
+
+
 # Model operations
 def create_model(db: Session, model: Queries.CreateModel) -> db_schemas.ModelName:
     db_model = db_schemas.ModelName(
@@ -485,11 +575,7 @@ def update_generation(
 
 def get_model_by_id(db: Session, model_id: int) -> Optional[db_schemas.ModelName]:
     """Get model by ID"""
-    return (
-        db.query(db_schemas.ModelName)
-        .filter(db_schemas.ModelName.model_id == model_id)
-        .first()
-    )
+    return db.get(db_schemas.ModelName, model_id)
 
 
 def get_all_model_names(db: Session) -> list[db_schemas.ModelName]:
@@ -500,35 +586,46 @@ def get_all_models(db: Session) -> list[db_schemas.ModelName]:
     return db.query(db_schemas.ModelName).all()
 
 
+def count_models(db: Session) -> int:
+    """Count models server-side without hydrating rows."""
+    return db.query(func.count()).select_from(db_schemas.ModelName).scalar()
+
+
 # Chat operations
 def create_chat(db: Session, chat: Queries.CreateChat, chat_id: str) -> db_schemas.Chat:
-    # check if chat_id is already present in the database or not
+    # INSERT ... ON CONFLICT DO NOTHING folds the existence check into the
+    # insert itself: the common case is one round trip, and only an actual
+    # collision falls back to fetching the existing row.
     chat_uuid = uuid.UUID(chat_id) if isinstance(chat_id, str) else chat_id
-    if existing_chat := get_chat_by_id(db, chat_uuid):
+    stmt = (
+        pg_insert(db_schemas.Chat)
+        .values(
+            chat_id=chat_uuid if chat_id else uuid.uuid4(),
+            project_id=chat.project_id,
+            user_id=chat.user_id,
+            title=chat.title,
+            created_at=datetime.now(),
+        )
+        .on_conflict_do_nothing(index_elements=["chat_id"])
+        .returning(db_schemas.Chat)
+    )
+    db_chat = db.execute(stmt).scalar_one_or_none()
+    db.commit()
+
+    if db_chat is None:
+        existing_chat = get_chat_by_id(db, chat_uuid)
         if (
             existing_chat.user_id != chat.user_id
             or existing_chat.project_id != chat.project_id
         ):
             raise ValueError("Chat ID already exists with different project/user.")
-        else:
-            # If chat already exists, just return it
-            return existing_chat
-
-    db_chat = db_schemas.Chat(
-        chat_id=chat_uuid if chat_id else uuid.uuid4(),
-        project_id=chat.project_id,
-        user_id=chat.user_id,
-        title=chat.title,
-        created_at=datetime.now(),
-    )
-    db.add(db_chat)
-    db.commit()
-    db.refresh(db_chat)
+        # If chat already exists, just return it
+        return existing_chat
     return db_chat
 
 
 def get_chat_by_id(db: Session, chat_id: uuid.UUID) -> Optional[db_schemas.Chat]:
-    return db.query(db_schemas.Chat).filter(db_schemas.Chat.chat_id == chat_id).first()
+    return db.get(db_schemas.Chat, chat_id)
 
 
 def update_chat(
@@ -591,6 +688,18 @@ def get_chats_for_user(db: Session, user_id: uuid.UUID) -> list[db_schemas.Chat]
     return db.query(db_schemas.Chat).filter(db_schemas.Chat.user_id == user_id).all()
 
 
+def user_has_chat(db: Session, user_id: uuid.UUID, chat_id: uuid.UUID) -> bool:
+    """Check chat ownership with an EXISTS query, without hydrating rows."""
+    return db.query(
+        db.query(db_schemas.Chat)
+        .filter(
+            db_schemas.Chat.user_id == user_id,
+            db_schemas.Chat.chat_id == chat_id,
+        )
+        .exists()
+    ).scalar()
+
+
 def get_chat_history(
     db: Session, chat_id: uuid.UUID
 ) -> list[
@@ -601,37 +710,42 @@ def get_chat_history(
     Returns a list of tuples containing (meta_query, context, generations)
     ordered by timestamp.
     """
-    # Get all chat queries for this chat
-    chat_queries = get_chat_queries_for_chat(db, chat_id)
-
-    # Get the chat metadata
-    chat = get_chat_by_id(db, chat_id)
-    if not chat:
-        return []
-
-    # Build the history
-    history = []
-    for chat_query in chat_queries:
-        # Get the meta query
-        meta_query = get_meta_query_by_id(db, chat_query.meta_query_id)
-        if not meta_query:
-            continue
-
-        # Get the context (contains user message)
-        context = get_context_by_id(db, meta_query.context_id)
-        if not context:
-            continue
-
-        # Get all generations for this query
-        generations = get_generations_by_meta_query_id(
-            db, str(meta_query.meta_query_id)
+    # One joined query instead of three lookups per chat query (N+1). The
+    # outer join keeps queries that have no generations yet; queries without
+    # a context are skipped, as before.
+    rows = (
+        db.query(db_schemas.MetaQuery, db_schemas.Context, db_schemas.HadGeneration)
+        .join(
+            db_schemas.ChatQuery,
+            db_schemas.ChatQuery.meta_query_id == db_schemas.MetaQuery.meta_query_id,
         )
+        .join(
+            db_schemas.Context,
+            db_schemas.Context.context_id == db_schemas.MetaQuery.context_id,
+        )
+        .outerjoin(
+            db_schemas.HadGeneration,
+            db_schemas.HadGeneration.meta_query_id
+            == db_schemas.MetaQuery.meta_query_id,
+        )
+        .filter(db_schemas.ChatQuery.chat_id == chat_id)
+        .order_by(db_schemas.MetaQuery.timestamp)
+        .all()
+    )
 
-        # Add to history
-        history.append((meta_query, context, generations))
-
-    # Sort by timestamp
-    history.sort(key=lambda x: x[0].timestamp)
+    # Group the flattened rows back into (meta_query, context, generations)
+    history: list[
+        tuple[db_schemas.MetaQuery, db_schemas.Context, list[db_schemas.HadGeneration]]
+    ] = []
+    entries_by_id = {}
+    for meta_query, context, generation in rows:
+        entry = entries_by_id.get(meta_query.meta_query_id)
+        if entry is None:
+            entry = (meta_query, context, [])
+            entries_by_id[meta_query.meta_query_id] = entry
+            history.append(entry)
+        if generation is not None:
+            entry[2].append(generation)
 
     return history
 
@@ -655,11 +769,7 @@ def delete_chat_cascade(db: Session, chat_id: uuid.UUID) -> bool:
 
 # Config Operations
 def get_config_by_id(db: Session, config_id: int) -> Optional[db_schemas.Config]:
-    return (
-        db.query(db_schemas.Config)
-        .filter(db_schemas.Config.config_id == config_id)
-        .first()
-    )
+    return db.get(db_schemas.Config, config_id)
 
 
 def create_config(db: Session, config: Queries.CreateConfig) -> db_schemas.Config:
@@ -713,24 +823,27 @@ def create_project(
 def get_project_by_id(
     db: Session, project_id: uuid.UUID
 ) -> Optional[db_schemas.Project]:
-    return (
-        db.query(db_schemas.Project)
-        .filter(db_schemas.Project.project_id == project_id)
-        .first()
-    )
+    return db.get(db_schemas.Project, project_id)
 
 
 def update_project(
     db: Session, project_id: uuid.UUID, project_update: Queries.UpdateProject
-) -> int:
+) -> Optional[db_schemas.Project]:
     update_data = project_update.dict(exclude_unset=True, to_json_values=True)
-    result = (
-        db.query(db_schemas.Project)
-        .filter(db_schemas.Project.project_id == project_id)
-        .update(update_data)  # type: ignore
-    )
+    for key in ("multi_file_contexts", "multi_file_context_changes"):
+        if isinstance(update_data.get(key), str):
+            # JSONB columns: store the parsed dict, not the serialized string
+            update_data[key] = json.loads(update_data[key])
+    # UPDATE ... RETURNING hands back the updated row in the same round trip,
+    # so callers don't need a follow-up SELECT
+    db_project = db.execute(
+        update(db_schemas.Project)
+        .where(db_schemas.Project.project_id == project_id)
+        .values(update_data)
+        .returning(db_schemas.Project)
+    ).scalar_one_or_none()
     db.commit()
-    return result
+    return db_project
 
 
 def get_projects_for_user(db: Session, user_id: uuid.UUID) -> list[db_schemas.Project]:
@@ -874,14 +987,22 @@ def get_sessions_for_user(db: Session, user_id: uuid.UUID) -> list[db_schemas.Se
     )
 
 
+def user_has_session(db: Session, user_id: uuid.UUID, session_id: uuid.UUID) -> bool:
+    """Check session ownership with an EXISTS query, without hydrating rows."""
+    return db.query(
+        db.query(db_schemas.Session)
+        .filter(
+            db_schemas.Session.user_id == user_id,
+            db_schemas.Session.session_id == session_id,
+        )
+        .exists()
+    ).scalar()
+
+
 def get_session_by_id(
     db: Session, session_id: uuid.UUID
 ) -> Optional[db_schemas.Session]:
-    return (
-        db.query(db_schemas.Session)
-        .filter(db_schemas.Session.session_id == session_id)
-        .first()
-    )
+    return db.get(db_schemas.Session, session_id)
 
 
 def delete_session_cascade(db: Session, session_id: uuid.UUID) -> bool:
@@ -930,42 +1051,45 @@ def get_all_programming_languages(db: Session) -> list[db_schemas.ProgrammingLan
     return db.query(db_schemas.ProgrammingLanguage).all()
 
 
+def count_programming_languages(db: Session) -> int:
+    """Count programming languages server-side without hydrating rows."""
+    return db.query(func.count()).select_from(db_schemas.ProgrammingLanguage).scalar()
+
+
 def get_all_trigger_types(db: Session) -> list[db_schemas.TriggerType]:
     return db.query(db_schemas.TriggerType).all()
 
 
+def count_trigger_types(db: Session) -> int:
+    """Count trigger types server-side without hydrating rows."""
+    return db.query(func.count()).select_from(db_schemas.TriggerType).scalar()
+
+
 def get_all_plugin_versions(db: Session) -> list[db_schemas.PluginVersion]:
     return db.query(db_schemas.PluginVersion).all()
 
 
+def count_plugin_versions(db: Session) -> int:
+    """Count plugin versions server-side without hydrating rows."""
+    return db.query(func.count()).select_from(db_schemas.PluginVersion).scalar()
+
+
 def get_programming_language_by_id(
     db: Session, language_id: int
 ) -> Optional[db_schemas.ProgrammingLanguage]:
-    return (
-        db.query(db_schemas.ProgrammingLanguage)
-        .filter(db_schemas.ProgrammingLanguage.language_id == language_id)
-        .first()
-    )
+    return db.get(db_schemas.ProgrammingLanguage, language_id)
 
 
 def get_trigger_type_by_id(
     db: Session, trigger_type_id: int
 ) -> Optional[db_schemas.TriggerType]:
-    return (
-        db.query(db_schemas.TriggerType)
-        .filter(db_schemas.TriggerType.trigger_type_id == trigger_type_id)
-        .first()
-    )
+    return db.get(db_schemas.TriggerType, trigger_type_id)
 
 
 def get_plugin_version_by_id(
     db: Session, version_id: int
 ) -> Optional[db_schemas.PluginVersion]:
-    return (
-        db.query(db_schemas.PluginVersion)
-        .filter(db_schemas.PluginVersion.version_id == version_id)
-        .first()
-    )
+    return db.get(db_schemas.PluginVersion, version_id)
 
 
 # Documentation Operations
@@ -992,15 +1116,43 @@ def create_documentation(
     return db_doc
 
 
+def bulk_create_documentation(
+    db: Session, docs: List[Queries.CreateDocumentation]
+) -> List[db_schemas.Documentation]:
+    """
+    Create multiple documentation entries in a single INSERT ... RETURNING.
+
+    Skips the per-row ORM instance overhead of create_documentation; rows whose
+    embedding generation fails are stored with embedding=None, matching the
+    single-row behavior.
+    """
+    rows = []
+    for doc in docs:
+        try:
+            embedding = encode_text(doc.content)
+        except Exception as e:
+            print(f"Warning: Failed to generate embedding: {e}")
+            embedding = None
+        rows.append(
+            {"content": doc.content, "language": doc.language, "embedding": embedding}
+        )
+
+    if not rows:
+        return []
+
+    result = db.execute(
+        insert(db_schemas.Documentation).returning(db_schemas.Documentation), rows
+    )
+    created_docs = list(result.scalars().all())
+    db.commit()
+    return created_docs
+
+
 def get_documentation_by_id(
     db: Session, doc_id: int
 ) -> Optional[db_schemas.Documentation]:
     """Get documentation by ID."""
-    return (
-        db.query(db_schemas.Documentation)
-        .filter(db_schemas.Documentation.documentation_id == doc_id)
-        .first()
-    )
+    return db.get(db_schemas.Documentation, doc_id)
 
 
 def get_all_documentation(
@@ -31,7 +31,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from .db import Base
@@ -98,7 +98,7 @@ class User(Base):
     config_id = Column(
         BigInteger, ForeignKey("public.config.config_id"), nullable=False
     )  # Reference to user configuration
-    preference = Column(Text)  # JSON user preferences
+    preference = Column(JSONB)  # User preferences as native JSON
     auth_token = Column(
         UUID(as_uuid=True), nullable=True
     )  # Current authentication token
@@ -283,11 +283,11 @@ class Project(Base):
     )  # Unique project identifier
     project_name = Column(String, nullable=False)  # Human-readable project name
     multi_file_contexts = Column(
-        Text, server_default="{}", default="{}"
-    )  # JSON: related file contexts
+        JSONB, server_default="{}", default=dict
+    )  # Related file contexts as native JSON
     multi_file_context_changes = Column(
-        Text, server_default="{}", default="{}"
-    )  # JSON: context change history
+        JSONB, server_default="{}", default=dict
+    )  # Context change history as native JSON
     created_at = Column(
         DateTime(timezone=True), nullable=False
     )  # Project creation timestamp
@@ -508,6 +508,10 @@ class CompletionQuery(Base):
         primary_key=True,
     )
 
+    # Parent query is joined eagerly: readers always need the shared fields,
+    # and the JOIN avoids a second SELECT per row
+    meta_query = relationship("MetaQuery", lazy="joined")
+
 
 class ChatQuery(Base):
     """
@@ -541,6 +545,10 @@ class ChatQuery(Base):
         Boolean, server_default="false", nullable=False, default=False
     )  # Whether web search is enabled
 
+    # Parent query is joined eagerly: readers always need the shared fields,
+    # and the JOIN avoids a second SELECT per row
+    meta_query = relationship("MetaQuery", lazy="joined")
+
 
 class HadGeneration(Base):
     """
@@ -21,7 +21,7 @@ CREATE TABLE IF NOT EXISTS public."user"
     is_oauth_signup BOOLEAN DEFAULT FALSE,
     verified BOOLEAN DEFAULT FALSE,
     config_id BIGINT NOT NULL,
-    preference TEXT,
+    preference JSONB,
     auth_token uuid NULL,
     is_admin BOOLEAN DEFAULT FALSE
 );
@@ -96,8 +96,8 @@ CREATE TABLE IF NOT EXISTS public.project
 (
     project_id uuid NOT NULL PRIMARY KEY,
     project_name VARCHAR NOT NULL,
-    multi_file_contexts text DEFAULT '{}',
-    multi_file_context_changes text DEFAULT '{}',
+    multi_file_contexts jsonb DEFAULT '{}',
+    multi_file_context_changes jsonb DEFAULT '{}',
     created_at timestamp with time zone NOT NULL
 );
 
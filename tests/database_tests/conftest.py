@@ -0,0 +1,103 @@
+import functools
+import itertools
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from argon2 import PasswordHasher
+
+import database.crud as crud
+import Queries
+import utils
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_create_user(email, name, password, config_id):
+    return Queries.CreateUser(
+        email=email, name=name, password=password, config_id=config_id
+    )
+
+
+@pytest.fixture
+def make_user_payload():
+    """
+    Memoized CreateUser payload factory.
+
+    Pydantic validation (EmailStr parse, password rules) runs once per
+    distinct kwargs instead of once per test; the crud helpers only read
+    from the payload, so reuse is safe.
+    """
+    return _cached_create_user
+
+# Preallocated pool of UUID strings. uuid4() reads os.urandom on every call;
+# generating a batch up front keeps that cost out of individual tests and
+# tight loops that consume many IDs.
+_UUID_POOL_SIZE = 4096
+_uuid_pool = iter([str(uuid.uuid4()) for _ in range(_UUID_POOL_SIZE)])
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_argon2():
+    """
+    Swap the production Argon2 hasher for a deliberately cheap one.
+
+    Argon2id is CPU-bound by design (roughly 100ms per hash) and almost every
+    test creates a user; the hashing parameters themselves are not under
+    test. Hashes are also memoized, since the fixtures reuse the same handful
+    of passwords across tests.
+    """
+    original_ph = utils.ph
+    original_hash = utils.hash_password
+
+    utils.ph = PasswordHasher(
+        time_cost=1, memory_cost=8, parallelism=1, hash_len=16, salt_len=8
+    )
+    cached_hash = functools.lru_cache(maxsize=None)(original_hash)
+    utils.hash_password = cached_hash
+    crud.hash_password = cached_hash
+
+    yield
+
+    utils.ph = original_ph
+    utils.hash_password = original_hash
+    crud.hash_password = original_hash
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_uuid():
+    """
+    Replace uuid4 with a counter-based generator inside crud only.
+
+    crud mints a primary key with uuid.uuid4() for every context, telemetry
+    and meta-query row; each call is a getrandom syscall. A monotonic counter
+    is collision-free within a run (every test's rows are rolled back) and
+    keeps the IDs deterministic. Only crud's view of the uuid module is
+    swapped, so nothing else in the process sees the shim.
+    """
+    counter = itertools.count(1)
+
+    def _sequential_uuid4() -> uuid.UUID:
+        return uuid.UUID(f"00000000-0000-4000-8000-{next(counter):012d}")
+
+    shim = SimpleNamespace(uuid4=_sequential_uuid4, UUID=uuid.UUID)
+    original = crud.uuid
+    crud.uuid = shim
+
+    yield
+
+    crud.uuid = original
+
+
+@pytest.fixture
+def fresh_uuid():
+    """Hands out UUID strings from the preallocated pool."""
+
+    def _next_uuid() -> str:
+        global _uuid_pool
+        try:
+            return next(_uuid_pool)
+        except StopIteration:
+            _uuid_pool = iter([str(uuid.uuid4()) for _ in range(_UUID_POOL_SIZE)])
+            return next(_uuid_pool)
+
+    return _next_uuid